@@ -1,31 +1,38 @@
 """
 A script that generates a series of events defining the state
 of the smart home over a two-month time period and saves
-them as SQL insert statements in `init_schema.sql`.
+them as SQL `COPY` statements in `init_data.sql`.
 """
 
 # STL
-import random
+import re
 import datetime
-from typing import Literal, Union
+from functools import cached_property
+from typing import Iterator, Literal, Tuple
 
 # PDM
+import numpy as np
 from meteostat import Point, Hourly
 
+# LOCAL
+from public.events.Event import STATE_KEY_TYPES
+
 
 SMART_HOME_LOCATION = Point(33.5186, -86.8104)  # Birmingham, Alabama
-TIME_MAP = {
-    "minute": 60,
-    "hour": 3600,
-    "day": 86400,
-    "week": 604800,
-    "month": 2592000,  # Assumes 30 days
-    "Tuesday": 86400,  # Assumes 0 = midnight on Monday
-    "Wednesday": 172800,
-    "Thursday": 259200,
-    "Friday": 345600,
-    "Saturday": 432000,
-    "Sunday": 518400,
+OUTPUT_BUFFER_SIZE = 1024 * 1024  # Bytes
+# Rows are copied from the lines following the statement, up to a line containing "\."
+COPY_STATEMENT_TEMPLATE = b"COPY pre_generated_events.%s FROM stdin;\n%s\\.\n\n"
+COPY_ROW_TEMPLATE = b"%d\t%s\t%s\t%s\t%s\n"  # Tab-separated columns
+BOOLEAN_SQL_VALUES = (b"false", b"true")  # Indexed by boolean state value
+# Lengths of time in seconds (app time 0 is midnight on a Monday)
+MINUTE = 60
+HOUR = 3600
+DAY = 86400
+WEEK = 604800
+# How long after each randomized event its concurrent event happens, by concurrent state key
+CONCURRENT_EVENT_OFFSETS = {
+    "clothesDryer": 30 * MINUTE,  # Run the clothes dryer 30 mins after the washer
+    "door": 30,
 }
 BOOLEAN_STATE_KEYS = [
     "bedroom1OverheadLight",
@@ -92,6 +99,26 @@ LIGHT_STATE_KEYS = [
     "livingRoomLamp2",
     "kitchenOverheadLight",
 ]
+HOUSE_DOOR_STATE_KEYS = ("frontDoor", "backDoor")
+GARAGE_CAR_DOOR_STATE_KEYS = ("garageCarDoor1", "garageCarDoor2")
+# Door event windows as (start offset, end offset, number of events, garage, random garage)
+WEEKEND_DOOR_SCHEDULE = (
+    (7 * HOUR, 22 * HOUR, 32, False, True),  # 7a-10p: 32x 30 sec door event
+)
+WEEKDAY_DOOR_SCHEDULE = (
+    # 7:15-7:45a: 4x 30 sec door event
+    (7 * HOUR + 15 * MINUTE, 7 * HOUR + 45 * MINUTE, 2, False, False),
+    (7 * HOUR + 15 * MINUTE, 7 * HOUR + 45 * MINUTE, 2, True, False),
+    # 3:45-4:15p: 2x 30 sec door event
+    (15 * HOUR + 45 * MINUTE, 16 * HOUR + 15 * MINUTE, 2, False, False),
+    # 5:15-5:45p: 2x 30 sec door event
+    (17 * HOUR + 15 * MINUTE, 17 * HOUR + 45 * MINUTE, 2, True, False),
+    # 6-8p: 8x 30 sec door event
+    (18 * HOUR, 20 * HOUR, 8, False, True),
+)
+STATE_KEY_WORD_START = re.compile(
+    r"(?<!^)(?=[A-Z0-9])"  # Upper case letters and digits
+)
 BEDROOM_BATHROOM_LIGHT_STATE_KEYS = {
     "adults": [
         "bedroom1OverheadLight",
@@ -109,92 +136,51 @@ BEDROOM_BATHROOM_LIGHT_STATE_KEYS = {
         "bathroom2OverheadLight",
     ],
 }
-STATE_TYPE = {
-    "outdoorTemp": "temp",
-    "thermostatTemp": "temp",
-    "bedroom1OverheadLight": "light",
-    "bedroom1Lamp1": "light",
-    "bedroom1Lamp2": "light",
-    "bedroom1Window1": "window",
-    "bedroom1Window2": "window",
-    "bedroom1Tv": "bedroomTv",
-    "bedroom2OverheadLight": "light",
-    "bedroom2Lamp1": "light",
-    "bedroom2Lamp2": "light",
-    "bedroom2Window1": "window",
-    "bedroom2Window2": "window",
-    "bedroom3OverheadLight": "light",
-    "bedroom3Lamp1": "light",
-    "bedroom3Lamp2": "light",
-    "bedroom3Window1": "window",
-    "bedroom3Window2": "window",
-    "bathroom1OverheadLight": "light",
-    "bathroom1ExhaustFan": "bathExhaustFan",
-    "bathroom1Window": "window",
-    "bathroom1Faucet": ("bath", "shower"),  # Not used in script
-    "bathroom2OverheadLight": "light",
-    "bathroom2ExhaustFan": "bathExhaustFan",
-    "bathroom2Window": "window",
-    "bathroom2Faucet": ("bath", "shower"),  # Not used in script
-    "clothesWasher": "clothesWasher",
-    "clothesDryer": "clothesDryer",
-    "frontDoor": "door",
-    "backDoor": "door",
-    "garageHouseDoor": "door",
-    "garageCarDoor1": "door",
-    "garageCarDoor2": "door",
-    "livingRoomOverheadLight": "light",
-    "livingRoomLamp1": "light",
-    "livingRoomLamp2": "light",
-    "livingRoomTv": "livingRoomTv",
-    "livingRoomWindow1": "window",
-    "livingRoomWindow2": "window",
-    "livingRoomWindow3": "window",
-    "kitchenOverheadLight": "light",
-    "kitchenStove": "stove",
-    "kitchenOven": "oven",
-    "kitchenMicrowave": "microwave",
-    "kitchenRefrigerator": "refrigerator",
-    "kitchenDishWasher": "dishWasher",
-    "kitchenWindow1": "window",
-    "kitchenWindow2": "window",
+ON_OFF_LABELS = ("OFF", "ON")
+OPEN_CLOSED_LABELS = ("CLOSED", "OPEN")
+BOOLEAN_STATE_LABELS = {  # Indexed by boolean state value
+    "light": ON_OFF_LABELS,
+    "bedroomTv": ON_OFF_LABELS,
+    "livingRoomTv": ON_OFF_LABELS,
+    "stove": ON_OFF_LABELS,
+    "oven": ON_OFF_LABELS,
+    "microwave": ON_OFF_LABELS,
+    "refrigerator": ON_OFF_LABELS,
+    "dishWasher": ON_OFF_LABELS,
+    "shower": ON_OFF_LABELS,
+    "bath": ON_OFF_LABELS,
+    "bathExhaustFan": ON_OFF_LABELS,
+    "clothesWasher": ON_OFF_LABELS,
+    "clothesDryer": ON_OFF_LABELS,
+    "door": OPEN_CLOSED_LABELS,
+    "window": OPEN_CLOSED_LABELS,
 }
 
 
 def humanReadableStateKey(stateKey: str) -> str:
-    parts = []
-    lastSplit = 0
-    for i in range(len(stateKey)):
-        c = stateKey[i]
-        if c.isupper() or c.isnumeric():
-            parts.append(stateKey[lastSplit:i].capitalize())
-            lastSplit = i
-    parts.append(stateKey[lastSplit:])
-    return " ".join(parts)
+    """Split a camel case state key into capitalized words (e.g. "Bedroom 1 Lamp 1")"""
+    return STATE_KEY_WORD_START.sub(" ", stateKey[:1].upper() + stateKey[1:])
 
 
 def booleanStateLabel(stateType: str, value: bool) -> str:
-    if stateType in [
-        "light",
-        "bedroomTv",
-        "livingRoomTv",
-        "stove",
-        "oven",
-        "microwave",
-        "refrigerator",
-        "dishWasher",
-        "shower",
-        "bath",
-        "bathExhaustFan",
-        "clothesWasher",
-        "clothesDryer",
-    ]:
-        labels = ("OFF", "ON")
-    elif stateType in ["door", "window"]:
-        labels = ("CLOSED", "OPEN")
-    else:
+    if stateType not in BOOLEAN_STATE_LABELS:
         raise ValueError(f"Invalid state type: {stateType}")
-    return labels[1] if value else labels[0]
+    return BOOLEAN_STATE_LABELS[stateType][value]
+
+
+def randomStateChanges(
+    rng: np.random.Generator, numSteps: int, numKeys: int, changeChance: float
+) -> Iterator[Tuple[int, int, bool]]:
+    """
+    Returns the step index, key index, and new value of every random (ON/OFF) state
+    change when each key has `changeChance` chance of changing at each step.
+    Every decision is drawn up front in a single array operation.
+    """
+    shape = (numSteps, numKeys)
+    changed = rng.random(shape) < changeChance
+    newValues = rng.random(shape) < 0.5
+    steps, keys = np.nonzero(changed)  # In step order, like the drawn decisions
+    return zip(steps.tolist(), keys.tolist(), newValues[changed].tolist())
 
 
 def celsiusToFahrenheit(celsius: float) -> int:
@@ -202,67 +188,136 @@ def celsiusToFahrenheit(celsius: float) -> int:
 
 
 def isSaturdayOrSunday(day: int) -> bool:
-    return (day != 0) and (
-        ((day % TIME_MAP["Saturday"]) == 0) or ((day % TIME_MAP["Sunday"]) == 0)
+    """`day` is the time at the start of the day, assuming 0 = midnight on Monday"""
+    return (day // DAY) % 7 >= 5
+
+
+# Start time of each day in the time period and whether it is a Saturday or Sunday
+DAY_STARTS = tuple(range(0, 60 * DAY, DAY))
+WEEKEND_FLAGS = tuple(isSaturdayOrSunday(day) for day in DAY_STARTS)
+
+# Event messages only depend on a small, fixed set of inputs, so they are built up front
+HUMAN_READABLE_STATE_KEYS = {
+    stateKey: humanReadableStateKey(stateKey) for stateKey in STATE_KEY_TYPES
+}
+BOOLEAN_EVENT_INFO = {  # (stateKey, isBath, isShower) -> ASCII-encoded SQL values
+    (stateKey, stateType == "bath", stateType == "shower"): (
+        stateType.encode(),
+        stateKey.encode(),
+        tuple(  # Messages by boolean state value
+            f"{HUMAN_READABLE_STATE_KEYS[stateKey]} is {booleanStateLabel(stateType, value)}".encode()
+            for value in (False, True)
+        ),
     )
+    for stateKey in BOOLEAN_STATE_KEYS
+    for stateType in STATE_KEY_TYPES[stateKey]  # Faucets: bath or shower
+}
+INTEGER_EVENT_INFO = {  # stateKey -> ASCII-encoded SQL values and message template
+    stateKey: (
+        STATE_KEY_TYPES[stateKey][0].encode(),
+        stateKey.encode(),
+        f"{HUMAN_READABLE_STATE_KEYS[stateKey]} is %d".encode(),
+    )
+    for stateKey in ("outdoorTemp", "thermostatTemp")
+}
 
 
 class StateGenerator:
     def __init__(self, weatherLocation, outputFilename):
         self.weatherLocation = weatherLocation
         self.outputFilename = outputFilename
-
-        # Create new output file
-        with open(outputFilename, "w") as f:
-            f.write(  # Clear tables before inserting fresh set of events
-                "DELETE FROM pre_generated_events.integer_event;\n"
-                "DELETE FROM pre_generated_events.boolean_event;\n\n"
-            )
+        self.rng = np.random.default_rng()  # For drawing many random numbers at once
+
+        # Create new output file, which is kept open (and buffered) until `close` is called
+        self.outputFile = open(outputFilename, "wb", buffering=OUTPUT_BUFFER_SIZE)
+        self.outputFile.write(  # Clear tables before inserting fresh set of events
+            b"BEGIN;\n"
+            b"DELETE FROM pre_generated_events.integer_event;\n"
+            b"DELETE FROM pre_generated_events.boolean_event;\n\n"
+        )
+        # Events waiting to be written, stored as parallel columns of
+        # (time, state type, state key, new value, message) for each table
+        self.pendingEvents = {
+            "boolean_event": ([], [], [], [], []),
+            "integer_event": ([], [], [], [], []),
+        }
+        # Column index of each pending (time, state key) row, so the latest event for a row wins
+        self.pendingEventIndices = {"boolean_event": {}, "integer_event": {}}
 
         # Set start time to be midnight, on Monday, and at least 60 days prior
-        startDate = datetime.date.today() - datetime.timedelta(days=61)
-        weekday = startDate.weekday()
-        startDate = startDate - datetime.timedelta(weekday)
+        # (ordinal 1 is Monday, January 1 of year 1, so Mondays are 1 more than a multiple of 7)
+        startOrdinal = datetime.date.today().toordinal() - 61
+        startOrdinal -= (startOrdinal - 1) % 7
+        startDate = datetime.date.fromordinal(startOrdinal)
         self.startDatetime = datetime.datetime(
             startDate.year, startDate.month, startDate.day
         )
 
+    def __enter__(self) -> "StateGenerator":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if exc[0] is None:
+            self.close()
+        else:  # Don't write a partial set of events if generating them failed
+            self.abort()
+
+    def close(self) -> None:
+        """Write all queued SQL statements and close the output file"""
+        self.flushEventCopyStatements()
+        self.outputFile.write(b"COMMIT;\n")
+        self.outputFile.flush()
+        self.outputFile.close()
+
+    def abort(self) -> None:
+        """
+        Roll back the transaction and close the output file without writing any queued
+        SQL statements, so that loading the file leaves the existing events untouched
+        """
+        self.outputFile.write(b"ROLLBACK;\n")
+        self.outputFile.flush()
+        self.outputFile.close()
+
     def generateInitialState(self) -> None:
         """Generates initial state, assuming t = 0 is a Monday at midnight"""
         for stateKey in BOOLEAN_STATE_KEYS:
             if stateKey == "kitchenRefrigerator":
-                self.writeBooleanEventInsertStatement(0, stateKey, True)
+                self.queueBooleanEvent(0, stateKey, True)
             elif stateKey in ["bathroom1Faucet", "bathroom2Faucet"]:
                 # Faucets are handled separately because they allow two types of events
-                self.writeBooleanEventInsertStatement(0, stateKey, False, isBath=True)
-                self.writeBooleanEventInsertStatement(0, stateKey, False, isShower=True)
+                self.queueBooleanEvent(0, stateKey, False, isBath=True)
+                self.queueBooleanEvent(0, stateKey, False, isShower=True)
             else:
-                self.writeBooleanEventInsertStatement(0, stateKey, False)
+                self.queueBooleanEvent(0, stateKey, False)
 
-        self.writeIntegerEventInsertStatement(0, "thermostatTemp", 70)
+        self.queueIntegerEvent(0, "thermostatTemp", 70)
 
-        weatherData = Hourly(
-            self.weatherLocation, self.startDatetime, self.startDatetime
-        )
-        weatherData = weatherData.fetch()
-        self.writeIntegerEventInsertStatement(
-            0, "outdoorTemp", celsiusToFahrenheit(weatherData.temp[0])
+        self.queueIntegerEvent(
+            0, "outdoorTemp", celsiusToFahrenheit(self.weatherData.temp.iloc[0])
         )
 
-    def generateTempEvents(self) -> None:
-        """Generate hourly weather data"""
-        weatherData = Hourly(
+    @cached_property
+    def weatherData(self):
+        """Hourly weather data for the whole time period, fetched only once"""
+        return Hourly(
             self.weatherLocation,
             self.startDatetime,
             self.startDatetime + datetime.timedelta(60),
-        )
-        weatherData = weatherData.fetch()
-        for i in range(len(weatherData)):
-            self.writeIntegerEventInsertStatement(
-                i * TIME_MAP["hour"],
-                "outdoorTemp",
-                celsiusToFahrenheit(weatherData.temp[i]),
-            )
+        ).fetch()
+
+    def generateTempEvents(self) -> None:
+        """Generate hourly weather data"""
+        weatherData = self.weatherData
+        times = np.arange(len(weatherData), dtype=np.int64) * HOUR
+        celsiusTemps = weatherData.temp.to_numpy()
+        # Missing hours would otherwise become garbage integers in the cast below
+        if np.isnan(celsiusTemps).any():
+            raise ValueError("Weather data is missing temps for some hours")
+        # Same conversion as `celsiusToFahrenheit`, applied to every hour at once
+        temps = ((9 / 5) * celsiusTemps).astype(np.int64) + 32
+        # `tolist` converts to Python ints, which keeps NumPy reprs out of the SQL
+        for time, temp in zip(times.tolist(), temps.tolist()):
+            self.queueIntegerEvent(time, "outdoorTemp", temp)
 
     def generateDoorEvents(self) -> None:
         """Generate door events"""
@@ -276,226 +331,182 @@ class StateGenerator:
         ) -> None:
             for _ in range(numToInsert):
                 if randGarage:
-                    garage = random.random() < 0.2
+                    garage = self.rng.random() < 0.2
                 if garage:
-                    self.writeRandomizedBooleanEventInsertStatements(
+                    self.queueRandomizedBooleanEvents(
                         t0,
                         t1,
                         30,
-                        random.choice(["garageCarDoor1", "garageCarDoor2"]),
+                        GARAGE_CAR_DOOR_STATE_KEYS[self.rng.integers(2)],
                         concurrentEventStateKey="garageHouseDoor",
                     )
                 else:
-                    self.writeRandomizedBooleanEventInsertStatements(
-                        t0, t1, 30, random.choice(["frontDoor", "backDoor"])
+                    self.queueRandomizedBooleanEvents(
+                        t0, t1, 30, HOUSE_DOOR_STATE_KEYS[self.rng.integers(2)]
                     )
 
         # Iterate over each day
-        for day in range(0, 60 * TIME_MAP["day"], TIME_MAP["day"]):
-            # S-S
-            if isSaturdayOrSunday(day):
-                # 7a-10p: 32x 30 sec door event
-                t0 = day + 7 * TIME_MAP["hour"]
-                t1 = day + 22 * TIME_MAP["hour"]
-                doorEvent(t0, t1, 32, randGarage=True)
-
-            # M-F
-            else:
-                # 7-7:30a: 4x 30 sec door event
-                morningStart = day + 7 * TIME_MAP["hour"] + 15 * TIME_MAP["minute"]
-                morningEnd = morningStart + 30 * TIME_MAP["minute"]
-                doorEvent(morningStart, morningEnd, 2)
-                doorEvent(morningStart, morningEnd, 2, garage=True)
-
-                # 3:45-4:15p: 2x 30 sec door event
-                kidsStart = day + 15 * TIME_MAP["hour"] + 45 * TIME_MAP["minute"]
-                kidsEnd = kidsStart + 30 * TIME_MAP["minute"]
-                doorEvent(kidsStart, kidsEnd, 2)
-
-                # 5:15-5:45p: 2x 30 sec door event
-                adultsStart = day + 17 * TIME_MAP["hour"] + 15 * TIME_MAP["minute"]
-                adultsEnd = adultsStart + 30 * TIME_MAP["minute"]
-                doorEvent(adultsStart, adultsEnd, 2, garage=True)
-
-                # 6-8p: 8x 30 sec door event
-                eveningStart = day + 18 * TIME_MAP["hour"]
-                eveningEnd = eveningStart + 2 * TIME_MAP["hour"]
-                doorEvent(eveningStart, eveningEnd, 8, randGarage=True)
+        for day, isWeekend in zip(DAY_STARTS, WEEKEND_FLAGS):
+            schedule = WEEKEND_DOOR_SCHEDULE if isWeekend else WEEKDAY_DOOR_SCHEDULE
+            for t0, t1, numToInsert, garage, randGarage in schedule:
+                doorEvent(day + t0, day + t1, numToInsert, garage, randGarage)
 
     def generateOvenStoveEvents(self) -> None:
         """Generate oven and stove events"""
         # Iterate over each day
-        for day in range(0, 60 * TIME_MAP["day"], TIME_MAP["day"]):
+        for day, isWeekend in zip(DAY_STARTS, WEEKEND_FLAGS):
             # S-S
-            if isSaturdayOrSunday(day):
+            if isWeekend:
                 # 5-7p: 30 min stove event
-                t0 = day + 17 * TIME_MAP["hour"]
-                t1 = day + 19 * TIME_MAP["hour"]
-                self.writeRandomizedBooleanEventInsertStatements(
-                    t0, t1, 30 * TIME_MAP["minute"], "kitchenStove"
-                )
+                t0 = day + 17 * HOUR
+                t1 = day + 19 * HOUR
+                self.queueRandomizedBooleanEvents(t0, t1, 30 * MINUTE, "kitchenStove")
 
                 # 4-7p: 60 min oven event
-                t0 = day + 16 * TIME_MAP["hour"]
-                t1 = day + 19 * TIME_MAP["hour"]
-                self.writeRandomizedBooleanEventInsertStatements(
-                    t0, t1, 60 * TIME_MAP["minute"], "kitchenOven"
-                )
+                t0 = day + 16 * HOUR
+                t1 = day + 19 * HOUR
+                self.queueRandomizedBooleanEvents(t0, t1, 60 * MINUTE, "kitchenOven")
 
             # M-F
             else:
                 # 5:45-7p: 15 min stove event
-                t0 = day + 17 * TIME_MAP["hour"] + 45 * TIME_MAP["minute"]
-                t1 = day + 19 * TIME_MAP["hour"]
-                self.writeRandomizedBooleanEventInsertStatements(
-                    t0, t1, 15 * TIME_MAP["minute"], "kitchenStove"
-                )
+                t0 = day + 17 * HOUR + 45 * MINUTE
+                t1 = day + 19 * HOUR
+                self.queueRandomizedBooleanEvents(t0, t1, 15 * MINUTE, "kitchenStove")
 
                 # 5:45-7p: 45 min oven event
-                t0 = day + 17 * TIME_MAP["hour"] + 45 * TIME_MAP["minute"]
-                t1 = day + 19 * TIME_MAP["hour"]
-                self.writeRandomizedBooleanEventInsertStatements(
-                    t0, t1, 45 * TIME_MAP["minute"], "kitchenOven"
-                )
+                t0 = day + 17 * HOUR + 45 * MINUTE
+                t1 = day + 19 * HOUR
+                self.queueRandomizedBooleanEvents(t0, t1, 45 * MINUTE, "kitchenOven")
 
     def generateMicrowaveEvents(self) -> None:
         """Generate microwave events"""
         # Iterate over each day
-        for day in range(0, 60 * TIME_MAP["day"], TIME_MAP["day"]):
+        for day, isWeekend in zip(DAY_STARTS, WEEKEND_FLAGS):
             # S-S
-            if isSaturdayOrSunday(day):
+            if isWeekend:
                 # 7a-10p: 6x 5 min microwave event
-                t0 = day + 7 * TIME_MAP["hour"]
-                t1 = day + 22 * TIME_MAP["hour"]
-                self.writeRandomizedBooleanEventInsertStatements(
-                    t0, t1, 5 * TIME_MAP["minute"], "kitchenMicrowave", numToInsert=6
+                t0 = day + 7 * HOUR
+                t1 = day + 22 * HOUR
+                self.queueRandomizedBooleanEvents(
+                    t0, t1, 5 * MINUTE, "kitchenMicrowave", numToInsert=6
                 )
 
             # M-F
             else:
                 # 5a-6a: 5 min microwave event
-                t0 = day + 5 * TIME_MAP["hour"]
-                t1 = day + 6 * TIME_MAP["hour"]
-                self.writeRandomizedBooleanEventInsertStatements(
-                    t0, t1, 5 * TIME_MAP["minute"], "kitchenMicrowave"
+                t0 = day + 5 * HOUR
+                t1 = day + 6 * HOUR
+                self.queueRandomizedBooleanEvents(
+                    t0, t1, 5 * MINUTE, "kitchenMicrowave"
                 )
 
                 # 6-7:15a: 5 min microwave event
-                t0 = day + 6 * TIME_MAP["hour"]
-                t1 = day + 7 * TIME_MAP["hour"] + 15 * TIME_MAP["minute"]
-                self.writeRandomizedBooleanEventInsertStatements(
-                    t0, t1, 5 * TIME_MAP["minute"], "kitchenMicrowave"
+                t0 = day + 6 * HOUR
+                t1 = day + 7 * HOUR + 15 * MINUTE
+                self.queueRandomizedBooleanEvents(
+                    t0, t1, 5 * MINUTE, "kitchenMicrowave"
                 )
 
                 # 4:15-4:45p: 5 min microwave event
-                t0 = day + 16 * TIME_MAP["hour"] + 15 * TIME_MAP["minute"]
-                t1 = day + 16 * TIME_MAP["hour"] + 45 * TIME_MAP["minute"]
-                self.writeRandomizedBooleanEventInsertStatements(
-                    t0, t1, 5 * TIME_MAP["minute"], "kitchenMicrowave"
+                t0 = day + 16 * HOUR + 15 * MINUTE
+                t1 = day + 16 * HOUR + 45 * MINUTE
+                self.queueRandomizedBooleanEvents(
+                    t0, t1, 5 * MINUTE, "kitchenMicrowave"
                 )
 
                 # 4:45-5:15p: 5 min microwave event
-                t0 = day + 16 * TIME_MAP["hour"] + 45 * TIME_MAP["minute"]
-                t1 = day + 17 * TIME_MAP["hour"] + 15 * TIME_MAP["minute"]
-                self.writeRandomizedBooleanEventInsertStatements(
-                    t0, t1, 5 * TIME_MAP["minute"], "kitchenMicrowave"
+                t0 = day + 16 * HOUR + 45 * MINUTE
+                t1 = day + 17 * HOUR + 15 * MINUTE
+                self.queueRandomizedBooleanEvents(
+                    t0, t1, 5 * MINUTE, "kitchenMicrowave"
                 )
 
     def generateTvEvents(self) -> None:
         """Generate bedroom TV and living room TV events"""
         # Iterate over each day
-        for day in range(0, 60 * TIME_MAP["day"], TIME_MAP["day"]):
+        for day, isWeekend in zip(DAY_STARTS, WEEKEND_FLAGS):
             # S-S
-            if isSaturdayOrSunday(day):
+            if isWeekend:
                 # 7a-10p: 8hr LR TV event
-                t0 = day + 7 * TIME_MAP["hour"]
-                t1 = day + 22 * TIME_MAP["hour"]
-                self.writeRandomizedBooleanEventInsertStatements(
-                    t0, t1, 8 * TIME_MAP["hour"], "livingRoomTv"
-                )
+                t0 = day + 7 * HOUR
+                t1 = day + 22 * HOUR
+                self.queueRandomizedBooleanEvents(t0, t1, 8 * HOUR, "livingRoomTv")
 
                 # 6a-10a: 2hr BR TV event
-                t0 = day + 6 * TIME_MAP["hour"]
-                t1 = day + 10 * TIME_MAP["hour"]
-                self.writeRandomizedBooleanEventInsertStatements(
-                    t0, t1, 2 * TIME_MAP["hour"], "bedroom1Tv"
-                )
+                t0 = day + 6 * HOUR
+                t1 = day + 10 * HOUR
+                self.queueRandomizedBooleanEvents(t0, t1, 2 * HOUR, "bedroom1Tv")
 
             # M-F
             else:
                 # 4:45-10p: 4hr LR TV event
-                t0 = day + 16 * TIME_MAP["hour"] + 45 * TIME_MAP["minute"]
-                t1 = day + 22 * TIME_MAP["hour"]
-                self.writeRandomizedBooleanEventInsertStatements(
-                    t0, t1, 4 * TIME_MAP["hour"], "livingRoomTv"
-                )
+                t0 = day + 16 * HOUR + 45 * MINUTE
+                t1 = day + 22 * HOUR
+                self.queueRandomizedBooleanEvents(t0, t1, 4 * HOUR, "livingRoomTv")
 
                 # 7p-10p: 2hr BR TV event
-                t0 = day + 19 * TIME_MAP["hour"]
-                t1 = day + 22 * TIME_MAP["hour"]
-                self.writeRandomizedBooleanEventInsertStatements(
-                    t0, t1, 2 * TIME_MAP["hour"], "bedroom1Tv"
-                )
+                t0 = day + 19 * HOUR
+                t1 = day + 22 * HOUR
+                self.queueRandomizedBooleanEvents(t0, t1, 2 * HOUR, "bedroom1Tv")
 
             # Any Day
             # 7p-10p: 2hr BR TV event
-            t0 = day + 19 * TIME_MAP["hour"]
-            t1 = day + 22 * TIME_MAP["hour"]
-            self.writeRandomizedBooleanEventInsertStatements(
-                t0, t1, 2 * TIME_MAP["hour"], "bedroom1Tv"
-            )
+            t0 = day + 19 * HOUR
+            t1 = day + 22 * HOUR
+            self.queueRandomizedBooleanEvents(t0, t1, 2 * HOUR, "bedroom1Tv")
 
     def generateShowerBathFanEvents(self) -> None:
         """Generate shower, bath, and bath exhaust fan events"""
         fan1 = "bathroom1ExhaustFan"
         fan2 = "bathroom2ExhaustFan"
         # Iterate over each day
-        for day in range(0, 60 * TIME_MAP["day"], TIME_MAP["day"]):
+        for day, isWeekend in zip(DAY_STARTS, WEEKEND_FLAGS):
             # S-S
-            if isSaturdayOrSunday(day):
+            if isWeekend:
                 # 6-7a: 15 min shower event
-                t0 = day + 6 * TIME_MAP["hour"]
-                t1 = day + 7 * TIME_MAP["hour"]
-                self.writeRandomizedBooleanEventInsertStatements(
+                t0 = day + 6 * HOUR
+                t1 = day + 7 * HOUR
+                self.queueRandomizedBooleanEvents(
                     t0,
                     t1,
-                    15 * TIME_MAP["minute"],
+                    15 * MINUTE,
                     "bathroom1Faucet",
                     isShower=True,
                     concurrentEventStateKey=fan1,
                 )
 
                 # 7-8a: 15 min shower event
-                t0 = day + 7 * TIME_MAP["hour"]
-                t1 = day + 8 * TIME_MAP["hour"]
-                self.writeRandomizedBooleanEventInsertStatements(
+                t0 = day + 7 * HOUR
+                t1 = day + 8 * HOUR
+                self.queueRandomizedBooleanEvents(
                     t0,
                     t1,
-                    15 * TIME_MAP["minute"],
+                    15 * MINUTE,
                     "bathroom2Faucet",
                     isShower=True,
                     concurrentEventStateKey=fan2,
                 )
 
                 # 11-12p: 15 min shower event
-                t0 = day + 11 * TIME_MAP["hour"]
-                t1 = day + 12 * TIME_MAP["hour"]
-                self.writeRandomizedBooleanEventInsertStatements(
+                t0 = day + 11 * HOUR
+                t1 = day + 12 * HOUR
+                self.queueRandomizedBooleanEvents(
                     t0,
                     t1,
-                    15 * TIME_MAP["minute"],
+                    15 * MINUTE,
                     "bathroom1Faucet",
                     isShower=True,
                     concurrentEventStateKey=fan1,
                 )
 
                 # 12-1p: 15 min bath event
-                t0 = day + 12 * TIME_MAP["hour"]
-                t1 = day + 13 * TIME_MAP["hour"]
-                self.writeRandomizedBooleanEventInsertStatements(
+                t0 = day + 12 * HOUR
+                t1 = day + 13 * HOUR
+                self.queueRandomizedBooleanEvents(
                     t0,
                     t1,
-                    15 * TIME_MAP["minute"],
+                    15 * MINUTE,
                     "bathroom1Faucet",
                     isBath=True,
                     concurrentEventStateKey=fan1,
@@ -504,24 +515,24 @@ class StateGenerator:
             # M-F
             else:
                 # 5:30-6:15a: 15 min shower event
-                t0 = day + 5 * TIME_MAP["hour"] + 30 * TIME_MAP["minute"]
-                t1 = day + 6 * TIME_MAP["hour"] + 15 * TIME_MAP["minute"]
-                self.writeRandomizedBooleanEventInsertStatements(
+                t0 = day + 5 * HOUR + 30 * MINUTE
+                t1 = day + 6 * HOUR + 15 * MINUTE
+                self.queueRandomizedBooleanEvents(
                     t0,
                     t1,
-                    15 * TIME_MAP["minute"],
+                    15 * MINUTE,
                     "bathroom1Faucet",
                     isShower=True,
                     concurrentEventStateKey=fan1,
                 )
 
                 # 6:15-7a: 15 min shower event
-                t0 = day + 6 * TIME_MAP["hour"] + 15 * TIME_MAP["minute"]
-                t1 = day + 7 * TIME_MAP["hour"]
-                self.writeRandomizedBooleanEventInsertStatements(
+                t0 = day + 6 * HOUR + 15 * MINUTE
+                t1 = day + 7 * HOUR
+                self.queueRandomizedBooleanEvents(
                     t0,
                     t1,
-                    15 * TIME_MAP["minute"],
+                    15 * MINUTE,
                     "bathroom2Faucet",
                     isShower=True,
                     concurrentEventStateKey=fan2,
@@ -529,24 +540,24 @@ class StateGenerator:
 
             # Any Day
             # 6-7p: 15 min bath event
-            t0 = day + 18 * TIME_MAP["hour"]
-            t1 = day + 19 * TIME_MAP["hour"]
-            self.writeRandomizedBooleanEventInsertStatements(
+            t0 = day + 18 * HOUR
+            t1 = day + 19 * HOUR
+            self.queueRandomizedBooleanEvents(
                 t0,
                 t1,
-                15 * TIME_MAP["minute"],
+                15 * MINUTE,
                 "bathroom1Faucet",
                 isBath=True,
                 concurrentEventStateKey=fan1,
             )
 
             # 7-8p: 15 min bath event
-            t0 = day + 19 * TIME_MAP["hour"]
-            t1 = day + 20 * TIME_MAP["hour"]
-            self.writeRandomizedBooleanEventInsertStatements(
+            t0 = day + 19 * HOUR
+            t1 = day + 20 * HOUR
+            self.queueRandomizedBooleanEvents(
                 t0,
                 t1,
-                15 * TIME_MAP["minute"],
+                15 * MINUTE,
                 "bathroom2Faucet",
                 isBath=True,
                 concurrentEventStateKey=fan2,
@@ -555,43 +566,43 @@ class StateGenerator:
     def generateDishwasherEvents(self) -> None:
         """Generate dishwasher events"""
         # Iterate over each week
-        for week in range(0, 8 * TIME_MAP["week"], TIME_MAP["week"]):
-            runDays = random.sample(range(7), 4)
+        for week in range(0, 8 * WEEK, WEEK):
+            runDays = self.rng.choice(7, 4, replace=False).tolist()
             # Any 4 days, 7-10p: 45 min dishWasher event
             for day in runDays:
-                t0 = week + day * TIME_MAP["day"] + 19 * TIME_MAP["hour"]
-                t1 = week + day * TIME_MAP["day"] + 22 * TIME_MAP["hour"]
-                self.writeRandomizedBooleanEventInsertStatements(
-                    t0, t1, 45 * TIME_MAP["minute"], "kitchenDishWasher"
+                t0 = week + day * DAY + 19 * HOUR
+                t1 = week + day * DAY + 22 * HOUR
+                self.queueRandomizedBooleanEvents(
+                    t0, t1, 45 * MINUTE, "kitchenDishWasher"
                 )
 
     def generateClothesWasherDryerEvents(self) -> None:
         """Generate clothes washer and clothes dryer events"""
         dryer = "clothesDryer"
         # Iterate over each week
-        for week in range(0, 8 * TIME_MAP["week"], TIME_MAP["week"]):
-            runDays = random.sample(range(7), 4)
+        for week in range(0, 8 * WEEK, WEEK):
+            runDays = self.rng.choice(7, 4, replace=False).tolist()
             # Any 4 days, 60 min clothes wash/dry event
             for day in runDays:
                 # 7-10p on weekdays
                 if day < 5:
-                    t0 = week + day * TIME_MAP["day"] + 19 * TIME_MAP["hour"]
-                    t1 = week + day * TIME_MAP["day"] + 22 * TIME_MAP["hour"]
-                    self.writeRandomizedBooleanEventInsertStatements(
+                    t0 = week + day * DAY + 19 * HOUR
+                    t1 = week + day * DAY + 22 * HOUR
+                    self.queueRandomizedBooleanEvents(
                         t0,
                         t1,
-                        30 * TIME_MAP["minute"],
+                        30 * MINUTE,
                         "clothesWasher",
                         concurrentEventStateKey=dryer,
                     )
                 # 8a-10p on weekends
                 else:
-                    t0 = week + day * TIME_MAP["day"] + 8 * TIME_MAP["hour"]
-                    t1 = week + day * TIME_MAP["day"] + 22 * TIME_MAP["hour"]
-                    self.writeRandomizedBooleanEventInsertStatements(
+                    t0 = week + day * DAY + 8 * HOUR
+                    t1 = week + day * DAY + 22 * HOUR
+                    self.queueRandomizedBooleanEvents(
                         t0,
                         t1,
-                        30 * TIME_MAP["minute"],
+                        30 * MINUTE,
                         "clothesWasher",
                         concurrentEventStateKey=dryer,
                     )
@@ -601,25 +612,24 @@ class StateGenerator:
 
         def randomLightChange(t0: int, t1: int) -> None:
             """Every 15 mins in a time period, all lights have 20% chance of random (ON/OFF) state change"""
-            for time in range(t0, t1, 15 * TIME_MAP["minute"]):
-                for stateKey in LIGHT_STATE_KEYS:
-                    if random.random() < 0.2:
-                        if random.random() < 0.5:
-                            self.writeBooleanEventInsertStatement(time, stateKey, True)
-                        else:
-                            self.writeBooleanEventInsertStatement(time, stateKey, False)
+            times = range(t0, t1, 15 * MINUTE)
+            changes = randomStateChanges(
+                self.rng, len(times), len(LIGHT_STATE_KEYS), 0.2
+            )
+            for i, j, newValue in changes:
+                self.queueBooleanEvent(times[i], LIGHT_STATE_KEYS[j], newValue)
 
         def kitchenLivingRoomLights(t0: int, t1: int, newValue: bool = True) -> None:
             """Control kitchen/living room lights"""
-            for stateKey in [
+            stateKeys = [
                 "livingRoomOverheadLight",
                 "livingRoomLamp1",
                 "livingRoomLamp2",
                 "kitchenOverheadLight",
-            ]:
-                self.writeBooleanEventInsertStatement(
-                    random.randint(t0, t1), stateKey, newValue
-                )
+            ]
+            times = self.rng.integers(t0, t1, len(stateKeys), endpoint=True).tolist()
+            for time, stateKey in zip(times, stateKeys):
+                self.queueBooleanEvent(time, stateKey, newValue)
 
         def bedroomBathroomLights(
             t0: int,
@@ -637,92 +647,92 @@ class StateGenerator:
                     BEDROOM_BATHROOM_LIGHT_STATE_KEYS["adults"]
                     + BEDROOM_BATHROOM_LIGHT_STATE_KEYS["kids"]
                 )
-            for stateKey in stateKeys:
-                self.writeBooleanEventInsertStatement(
-                    random.randint(t0, t1), stateKey, newValue
-                )
+            times = self.rng.integers(t0, t1, len(stateKeys), endpoint=True).tolist()
+            for time, stateKey in zip(times, stateKeys):
+                self.queueBooleanEvent(time, stateKey, newValue)
 
         def allLightsOff(t0: int, t1: int) -> None:
-            for stateKey in LIGHT_STATE_KEYS:
-                self.writeBooleanEventInsertStatement(
-                    random.randint(t0, t1), stateKey, False
-                )
+            times = self.rng.integers(
+                t0, t1, len(LIGHT_STATE_KEYS), endpoint=True
+            ).tolist()
+            for time, stateKey in zip(times, LIGHT_STATE_KEYS):
+                self.queueBooleanEvent(time, stateKey, False)
 
         # Iterate over each day
-        for day in range(0, 60 * TIME_MAP["day"], TIME_MAP["day"]):
+        for day, isWeekend in zip(DAY_STARTS, WEEKEND_FLAGS):
             # S-S
-            if isSaturdayOrSunday(day):
+            if isWeekend:
                 # 6-6:15a: bedroom lights + bathroom lights come on
-                t0 = day + 6 * TIME_MAP["hour"]
-                t1 = day + 6 * TIME_MAP["hour"] + 15 * TIME_MAP["minute"]
+                t0 = day + 6 * HOUR
+                t1 = day + 6 * HOUR + 15 * MINUTE
                 bedroomBathroomLights(t0, t1)
 
                 # 8-8:15a: kitchen/living room lights come on
-                t0 = day + 8 * TIME_MAP["hour"]
-                t1 = day + 8 * TIME_MAP["hour"] + 15 * TIME_MAP["minute"]
+                t0 = day + 8 * HOUR
+                t1 = day + 8 * HOUR + 15 * MINUTE
                 kitchenLivingRoomLights(t0, t1)
 
                 # Every 15 mins, all lights have 20% chance of state change
-                t0 = day + 8 * TIME_MAP["hour"] + 15 * TIME_MAP["minute"]
-                t1 = day + 17 * TIME_MAP["hour"]
+                t0 = day + 8 * HOUR + 15 * MINUTE
+                t1 = day + 17 * HOUR
                 randomLightChange(t0, t1)
 
                 # 5-5:30p: kitchen/living room lights all turn on if not already on
-                t0 = day + 17 * TIME_MAP["hour"]
-                t1 = day + 17 * TIME_MAP["hour"] + 30 * TIME_MAP["minute"]
+                t0 = day + 17 * HOUR
+                t1 = day + 17 * HOUR + 30 * MINUTE
                 kitchenLivingRoomLights(t0, t1)
 
                 # 8-8:30p: bedroom/bathroom lights all turn on if not already
-                t0 = day + 20 * TIME_MAP["hour"]
-                t1 = day + 20 * TIME_MAP["hour"] + 30 * TIME_MAP["minute"]
+                t0 = day + 20 * HOUR
+                t1 = day + 20 * HOUR + 30 * MINUTE
                 bedroomBathroomLights(t0, t1)
 
                 # 10-10:30p: all lights turn off
-                t0 = day + 22 * TIME_MAP["hour"]
-                t1 = day + 22 * TIME_MAP["hour"] + 30 * TIME_MAP["minute"]
+                t0 = day + 22 * HOUR
+                t1 = day + 22 * HOUR + 30 * MINUTE
                 allLightsOff(t0, t1)
 
             # M-F
             else:
                 # 5a-5:15a: adults wake up, bed/bath lights come on
-                t0 = day + 5 * TIME_MAP["hour"]
-                t1 = day + 5 * TIME_MAP["hour"] + 15 * TIME_MAP["minute"]
+                t0 = day + 5 * HOUR
+                t1 = day + 5 * HOUR + 15 * MINUTE
                 bedroomBathroomLights(t0, t1, include="adults")
 
                 # 5:15-5:30a: kitchen/living room lights come on, master bedroom/bathroom lights off
-                t0 = day + 5 * TIME_MAP["hour"] + 15 * TIME_MAP["minute"]
-                t1 = day + 5 * TIME_MAP["hour"] + 30 * TIME_MAP["minute"]
+                t0 = day + 5 * HOUR + 15 * MINUTE
+                t1 = day + 5 * HOUR + 30 * MINUTE
                 kitchenLivingRoomLights(t0, t1)
                 bedroomBathroomLights(t0, t1, False, "adults")
 
                 # 6a-6:15a: kids wake up, bed/bath lights come on
-                t0 = day + 6 * TIME_MAP["hour"]
-                t1 = day + 6 * TIME_MAP["hour"] + 15 * TIME_MAP["minute"]
+                t0 = day + 6 * HOUR
+                t1 = day + 6 * HOUR + 15 * MINUTE
                 bedroomBathroomLights(t0, t1, include="kids")
 
                 # 7:15-7:30a: all lights go off
-                t0 = day + 7 * TIME_MAP["hour"] + 15 * TIME_MAP["minute"]
-                t1 = day + 7 * TIME_MAP["hour"] + 30 * TIME_MAP["minute"]
+                t0 = day + 7 * HOUR + 15 * MINUTE
+                t1 = day + 7 * HOUR + 30 * MINUTE
                 allLightsOff(t0, t1)
 
                 # 4:00-4:15p: kitchen/living room lights come on
-                t0 = day + 16 * TIME_MAP["hour"]
-                t1 = day + 16 * TIME_MAP["hour"] + 15 * TIME_MAP["minute"]
+                t0 = day + 16 * HOUR
+                t1 = day + 16 * HOUR + 15 * MINUTE
                 kitchenLivingRoomLights(t0, t1)
 
                 # Every 15 mins, all lights have 20% chance of state change
-                t0 = day + 16 * TIME_MAP["hour"] + 15 * TIME_MAP["minute"]
-                t1 = day + 20 * TIME_MAP["hour"]
+                t0 = day + 16 * HOUR + 15 * MINUTE
+                t1 = day + 20 * HOUR
                 randomLightChange(t0, t1)
 
                 # 8-8:15p: bedroom, bathroom lights turn on
-                t0 = day + 20 * TIME_MAP["hour"]
-                t1 = day + 20 * TIME_MAP["hour"] + 15 * TIME_MAP["minute"]
+                t0 = day + 20 * HOUR
+                t1 = day + 20 * HOUR + 15 * MINUTE
                 bedroomBathroomLights(t0, t1)
 
                 # 8:30-8:45p: kids lights off, living room/kitchen lights off
-                t0 = day + 20 * TIME_MAP["hour"] + 30 * TIME_MAP["minute"]
-                t1 = day + 20 * TIME_MAP["hour"] + 45 * TIME_MAP["minute"]
+                t0 = day + 20 * HOUR + 30 * MINUTE
+                t1 = day + 20 * HOUR + 45 * MINUTE
                 bedroomBathroomLights(t0, t1, False, include="kids")
                 kitchenLivingRoomLights(t0, t1, False)
 
@@ -739,36 +749,66 @@ class StateGenerator:
         # This will be empty
         pass
 
-    def writeEventInsertStatement(
+    def queueEvent(
         self,
         table: Literal["boolean_event", "integer_event"],
         time: int,
-        stateType: str,
-        stateKey: str,
-        newValue: Union[bool, int],
-        message: str,
+        stateType: bytes,
+        stateKey: bytes,
+        newValue: bytes,
+        message: bytes,
     ) -> None:
-        """Append an SQL insert statement for the specified event to the output file"""
-        assert table in ["boolean_event", "integer_event"]
-        with open(self.outputFilename, "a") as f1:
-            f1.write(
-                f"INSERT INTO pre_generated_events.{table}\n\t"
-                f"VALUES ({time}, '{stateType}', '{stateKey}', {newValue}, '{message}')\n\t"
-                f"ON CONFLICT (time, state_key) DO UPDATE\n\t"
-                f"SET time={time}, state_type='{stateType}', state_key='{stateKey}', new_value={newValue}, message='{message}';\n\n"
-            )
+        """
+        Queue the specified event to be written in an SQL copy statement.
+        All values other than `time` should be ASCII-encoded, tab-free text.
+        """
+        # Rows are only written on `close`, so the copied rows never conflict
+        times, stateTypes, stateKeys, newValues, messages = self.pendingEvents[table]
+        indices = self.pendingEventIndices[table]
+        i = indices.get((time, stateKey))
+        if i is None:
+            indices[(time, stateKey)] = len(times)
+            times.append(time)
+            stateTypes.append(stateType)
+            stateKeys.append(stateKey)
+            newValues.append(newValue)
+            messages.append(message)
+        else:
+            stateTypes[i] = stateType
+            newValues[i] = newValue
+            messages[i] = message
+
+    def flushEventCopyStatements(self) -> None:
+        """Append SQL copy statements for all queued events to the output file"""
+        for table in self.pendingEvents:
+            self.flushEventCopyStatement(table)
 
-    def writeIntegerEventInsertStatement(
-        self, time: int, stateKey: str, newValue: int
+    def flushEventCopyStatement(
+        self, table: Literal["boolean_event", "integer_event"]
     ) -> None:
-        """Append an SQL insert statement for the specified integer event to the output file"""
-        stateType = STATE_TYPE[stateKey]
-        message = f"{humanReadableStateKey(stateKey)} is {newValue}"
-        self.writeEventInsertStatement(
-            "integer_event", time, stateType, stateKey, newValue, message
+        """Append an SQL copy statement for all queued events of a table to the output file"""
+        columns = self.pendingEvents[table]
+        if not columns[0]:
+            return
+        rows = b"".join([COPY_ROW_TEMPLATE % row for row in zip(*columns)])
+        self.outputFile.write(COPY_STATEMENT_TEMPLATE % (table.encode(), rows))
+        for column in columns:
+            column.clear()
+        self.pendingEventIndices[table].clear()
+
+    def queueIntegerEvent(self, time: int, stateKey: str, newValue: int) -> None:
+        """Queue the specified integer event to be written to the output file on `close`"""
+        stateType, encodedStateKey, messageTemplate = INTEGER_EVENT_INFO[stateKey]
+        self.queueEvent(
+            "integer_event",
+            time,
+            stateType,
+            encodedStateKey,
+            b"%d" % newValue,
+            messageTemplate % newValue,
         )
 
-    def writeBooleanEventInsertStatement(
+    def queueBooleanEvent(
         self,
         time: int,
         stateKey: str,
@@ -776,20 +816,20 @@ class StateGenerator:
         isBath: bool = False,
         isShower: bool = False,
     ) -> None:
-        """Append an SQL insert statement for the specified boolean event to the output file"""
-        assert not (isBath and isShower)
-        if isBath:
-            stateType = "bath"
-        elif isShower:
-            stateType = "shower"
-        else:
-            stateType = STATE_TYPE[stateKey]
-        message = f"{humanReadableStateKey(stateKey)} is {booleanStateLabel(stateType, newValue)}"
-        self.writeEventInsertStatement(
-            "boolean_event", time, stateType, stateKey, newValue, message
+        """Queue the specified boolean event to be written to the output file on `close`"""
+        stateType, encodedStateKey, messages = BOOLEAN_EVENT_INFO[
+            (stateKey, isBath, isShower)
+        ]
+        self.queueEvent(
+            "boolean_event",
+            time,
+            stateType,
+            encodedStateKey,
+            BOOLEAN_SQL_VALUES[newValue],
+            messages[newValue],
         )
 
-    def writeRandomizedBooleanEventInsertStatements(
+    def queueRandomizedBooleanEvents(
         self,
         t0: int,
         t1: int,
@@ -800,34 +840,23 @@ class StateGenerator:
         concurrentEventStateKey: str = None,
         numToInsert: int = 1,
     ) -> None:
-        for _ in range(numToInsert):
-            # Determine time of door events and insert into database
-            eventStart = random.randint(t0, t1)
+        # Handle things that are contingent on other things - lights/bath fans
+        concurrentEventOffset = CONCURRENT_EVENT_OFFSETS.get(concurrentEventStateKey, 0)
+
+        # Determine time of events, all at once, and queue them
+        eventStarts = self.rng.integers(t0, t1, numToInsert, endpoint=True).tolist()
+        for eventStart in eventStarts:
             eventStop = eventStart + duration
 
-            self.writeBooleanEventInsertStatement(
-                eventStart, stateKey, True, isBath, isShower
-            )
-            self.writeBooleanEventInsertStatement(
-                eventStop, stateKey, False, isBath, isShower
-            )
+            self.queueBooleanEvent(eventStart, stateKey, True, isBath, isShower)
+            self.queueBooleanEvent(eventStop, stateKey, False, isBath, isShower)
 
-            # Handle things that are contingent on other things - lights/bath fans
             if concurrentEventStateKey is not None:
-                # Special handler for running clothes dryer 30 mins after washer
-                if concurrentEventStateKey == "clothesDryer":
-                    eventStart += 30 * TIME_MAP["minute"]
-                    eventStop += 30 * TIME_MAP["minute"]
-
-                if concurrentEventStateKey == "door":
-                    eventStart += 30
-                    eventStop += 30
-
-                self.writeBooleanEventInsertStatement(
-                    eventStart, concurrentEventStateKey, True
+                self.queueBooleanEvent(
+                    eventStart + concurrentEventOffset, concurrentEventStateKey, True
                 )
-                self.writeBooleanEventInsertStatement(
-                    eventStop, concurrentEventStateKey, False
+                self.queueBooleanEvent(
+                    eventStop + concurrentEventOffset, concurrentEventStateKey, False
                 )
 
     def convertToDate(self, time: int) -> datetime.datetime:
@@ -848,8 +877,10 @@ class StateGenerator:
 
 
 def main() -> None:
-    stateGenerator = StateGenerator(SMART_HOME_LOCATION, outputFilename="init_data.sql")
-    stateGenerator.run()
+    with StateGenerator(
+        SMART_HOME_LOCATION, outputFilename="init_data.sql"
+    ) as stateGenerator:
+        stateGenerator.run()
 
 
 if __name__ == "__main__":
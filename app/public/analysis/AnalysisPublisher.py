@@ -1,15 +1,14 @@
 # STL
 from logging import Logger
-from typing import TypedDict, cast
+from typing import TypedDict
 
 # PDM
 from flask import Flask
-from typeguard import typechecked
 from apscheduler.schedulers.background import BackgroundScheduler
 
 # LOCAL
 from public.time.AppClock import AppClock
-from public.events.Event import IntegerEvent, BooleanEvent, isBooleanEvent
+from public.events.Event import IntegerEvent, BOOLEAN_STATE_TYPES
 from public.events.EventStore import EventStore
 from public.sse.SSEPublisher import SSEPublisher, TimeType
 from public.analysis.Formulas import Formulas
@@ -50,6 +49,18 @@ class AnalysisPublisher(SSEPublisher):
     utility usage data based on events that occurred since the last calculation.
     """
 
+    __slots__ = (
+        "lastPublishTime",
+        "lastCalculationTime",
+        "indoorTemp",
+        "outdoorTemp",
+        "thermostatTemp",
+        "eventStore",
+        "outdoorTempStateKey",
+        "thermostatTempStateKey",
+        "booleanStateTrackerMap",
+    )
+
     sseType: str = "analysis"
     lastPublishTime: int
     lastCalculationTime: int
@@ -62,7 +73,6 @@ class AnalysisPublisher(SSEPublisher):
     booleanStateTrackerMap: BooleanStateTrackerMap
 
     # Override
-    @typechecked
     def __init__(
         self,
         logger: Logger,
@@ -141,22 +151,24 @@ class AnalysisPublisher(SSEPublisher):
         """
         Publishes an `AnalysisObject` as a SSE.
         """
-        electricityUsage = 0
-        self.booleanStateTrackerMap.resetTotalTimeTrue()
+        electricityUsage = 0.0
+        booleanStateTrackerMap = self.booleanStateTrackerMap
+        booleanStateTrackerMap.resetTotalTimeTrue()
 
         start = self.lastPublishTime
         end = self.lastPublishTime = int(self.clock.time())
+        # Local aliases for the loop below, which runs for every event
+        # (the events are not `cast`, since that is a function call at runtime)
+        processBooleanEvent = booleanStateTrackerMap.processEvent
+        processIntegerEvent = self.updateIndoorTempAndReturnHvacElectricityUsage
         for event in self.eventStore.yieldEvents(start, end):
-            if isBooleanEvent(event):
-                self.booleanStateTrackerMap.processEvent(cast(BooleanEvent, event))
+            if event["state_type"] in BOOLEAN_STATE_TYPES:
+                processBooleanEvent(event)
             else:  # Integer event: outdoor temp or thermostat temp
-                electricityUsage += self.updateIndoorTempAndReturnHvacElectricityUsage(
-                    cast(IntegerEvent, event)
-                )
-        electricityUsage += self.booleanStateTrackerMap.getTotalElectricityUsage()
+                electricityUsage += processIntegerEvent(event)
+        booleanElectricityUsage, waterUsage = booleanStateTrackerMap.getTotalUsage()
+        electricityUsage += booleanElectricityUsage
         electricityCost = Formulas.electricityCost(electricityUsage, end - start)
-
-        waterUsage = self.booleanStateTrackerMap.getTotalWaterUsage()
         waterCost = Formulas.waterCost(waterUsage)
 
         analysisObject = AnalysisObject(
@@ -1,8 +1,5 @@
 # STL
-from typing import Set, Dict
-
-# PDM
-from typeguard import typechecked
+from typing import Set, Dict, List, Tuple
 
 # LOCAL
 from public.events.Event import (
@@ -15,7 +12,6 @@ from public.events.Event import (
 from public.events.EventStore import EventStore
 from public.analysis.Formulas import Formulas
 from public.analysis.UsageRate import (
-    ElectricityUsageRate,
     ELECTRICITY_USAGE_RATE_MAP,
     WaterUsageRate,
     WATER_USAGE_RATE_MAP,
@@ -31,39 +27,49 @@ class BooleanStateTracker:
     - the total amount of water an appliance has used
     """
 
+    __slots__ = (
+        "type",
+        "key",
+        "value",
+        "lastTimeTrue",
+        "totalTimeTrue",
+        "wattsPerSecond",
+        "gallonsPerSecond",
+        "percentHot",
+    )
+
     type: StateType
     key: StateKey
     value: bool
     lastTimeTrue: int
     totalTimeTrue: int
-    electricityUsageRate: ElectricityUsageRate
-    waterUsageRate: WaterUsageRate
+    wattsPerSecond: float
+    gallonsPerSecond: float
+    percentHot: float
 
-    @typechecked
     def __init__(self, firstEvent: BooleanEvent) -> None:
         self.type = firstEvent["state_type"]
         self.key = firstEvent["state_key"]
         self.value = firstEvent["new_value"]
         self.lastTimeTrue = firstEvent["time"]
         self.totalTimeTrue = 0
-        self.electricityUsageRate = ELECTRICITY_USAGE_RATE_MAP.get(
-            self.type, ElectricityUsageRate(wattsPerSecond=0)
-        )
-        self.waterUsageRate = WATER_USAGE_RATE_MAP.get(
+        self.wattsPerSecond = ELECTRICITY_USAGE_RATE_MAP.get(self.type, 0)
+        self.gallonsPerSecond, self.percentHot = WATER_USAGE_RATE_MAP.get(
             self.type, WaterUsageRate(gallonsPerSecond=0, percentHot=0)
         )
 
-    @typechecked
+    # Not @typechecked, since this runs for every event
     def processEvent(self, event: BooleanEvent) -> None:
         if not event["state_key"] == self.key:
             raise ValueError(f'`event` should be a "{self.key}" event!')
 
-        if self.value and not event["new_value"]:  # Closed or turned off
+        value = self.value
+        newValue = event["new_value"]
+        if value and not newValue:  # Closed or turned off
             self.totalTimeTrue += event["time"] - self.lastTimeTrue
-            self.value = event["new_value"]
-        elif not self.value and event["new_value"]:  # Opened or turned on
+        elif newValue and not value:  # Opened or turned on
             self.lastTimeTrue = event["time"]
-            self.value = event["new_value"]
+        self.value = newValue
 
     def resetTotalTimeTrue(self) -> None:
         self.totalTimeTrue = 0
@@ -71,48 +77,48 @@ class BooleanStateTracker:
     def getTotalTimeTrue(self) -> int:
         return self.totalTimeTrue
 
-    def getTotalElectricityUsage(self) -> float:
-        baseUsage = Formulas.electricityUsage(
-            self.electricityUsageRate["wattsPerSecond"], self.totalTimeTrue
-        )
+    def getTotalUsage(self) -> Tuple[float, float]:
+        """
+        Returns the total electricity usage and the total water usage.
+        """
+        baseUsage = Formulas.electricityUsage(self.wattsPerSecond, self.totalTimeTrue)
         waterHeaterUsage = Formulas.waterHeaterElectricityUsage(
-            self.waterUsageRate["gallonsPerSecond"],
-            self.totalTimeTrue,
-            self.waterUsageRate["percentHot"],
-        )
-        return baseUsage + waterHeaterUsage
-
-    def getTotalWaterUsage(self) -> float:
-        return Formulas.waterUsage(
-            self.waterUsageRate["gallonsPerSecond"], self.totalTimeTrue
+            self.gallonsPerSecond, self.totalTimeTrue, self.percentHot
         )
+        waterUsage = Formulas.waterUsage(self.gallonsPerSecond, self.totalTimeTrue)
+        return baseUsage + waterHeaterUsage, waterUsage
 
 
 class BooleanStateTrackerMap:
     """
-    Helper class wrapping a nested mapping of `BooleanStateTracker` objects to support
+    Helper class wrapping a flat mapping of `BooleanStateTracker` objects to support
     easy sum tracking for many differently-typed pieces of boolean smart home state.
     """
 
+    __slots__ = ("eventStore", "map", "trackersByType")
+
     eventStore: EventStore
-    map: Dict[BooleanStateType, Dict[BooleanStateKey, BooleanStateTracker]]
+    map: Dict[Tuple[BooleanStateType, BooleanStateKey], BooleanStateTracker]
+    trackersByType: Dict[BooleanStateType, List[BooleanStateTracker]]
 
-    @typechecked
     def __init__(self, eventStore: EventStore) -> None:
         self.eventStore = eventStore
         self.map = {}
+        self.trackersByType = {}
 
-    @typechecked
+    # Not @typechecked, since this runs for every event
     def processEvent(self, event: BooleanEvent) -> None:
-        stateType, stateKey = event["state_type"], event["state_key"]
-        if stateType not in self.map:
-            self.map[stateType] = {}
-        if stateKey not in self.map[stateType]:
-            self.map[stateType][stateKey] = BooleanStateTracker(event)
-        self.map[stateType][stateKey].processEvent(event)
+        # Keyed by state type too, since faucets have both bath and shower events
+        key = (event["state_type"], event["state_key"])
+        tracker = self.map.get(key)
+        if tracker is None:
+            tracker = self.map[key] = BooleanStateTracker(event)
+            self.trackersByType.setdefault(event["state_type"], []).append(tracker)
+        tracker.processEvent(event)
 
     def clear(self) -> None:
         self.map = {}
+        self.trackersByType = {}
 
     def resetTotalTimeTrue(self, stateTypes: Set[BooleanStateType] = None) -> None:
         """
@@ -121,12 +127,11 @@ class BooleanStateTrackerMap:
         """
         if stateTypes:
             for stateType in stateTypes:
-                for tracker in self.map.get(stateType, {}).values():
+                for tracker in self.trackersByType.get(stateType, ()):
                     tracker.resetTotalTimeTrue()
         else:
-            for stateType in self.map:
-                for tracker in self.map[stateType].values():
-                    tracker.resetTotalTimeTrue()
+            for tracker in self.map.values():
+                tracker.resetTotalTimeTrue()
 
     def resetOpenDoorTime(self) -> None:
         """
@@ -145,16 +150,13 @@ class BooleanStateTrackerMap:
         Returns the total time true of all tracked pieces of state with the given state types.
         If state types are not provided, all tracked pieces of state are included.
         """
-        total = 0
         if stateTypes:
+            total = 0
             for stateType in stateTypes:
-                for tracker in self.map.get(stateType, {}).values():
-                    total += tracker.getTotalTimeTrue()
-        else:
-            for stateType in self.map:
-                for tracker in self.map[stateType].values():
+                for tracker in self.trackersByType.get(stateType, ()):
                     total += tracker.getTotalTimeTrue()
-        return total
+            return total
+        return sum(tracker.getTotalTimeTrue() for tracker in self.map.values())
 
     def getTotalOpenDoorTime(self) -> float:
         """
@@ -168,22 +170,15 @@ class BooleanStateTrackerMap:
         """
         return self.getTotalTimeTrue({"window"})
 
-    def getTotalElectricityUsage(self) -> float:
-        """
-        Returns the total electricity usage of all tracked pieces of state.
-        """
-        total = 0
-        for stateType in self.map:
-            for tracker in self.map[stateType].values():
-                total += tracker.getTotalElectricityUsage()
-        return total
-
-    def getTotalWaterUsage(self) -> float:
+    def getTotalUsage(self) -> Tuple[float, float]:
         """
-        Returns the total water usage of all tracked pieces of state.
+        Returns the total electricity usage and the total water usage of all tracked
+        pieces of state, skipping those with no time true since it was last reset.
         """
-        total = 0
-        for stateType in self.map:
-            for tracker in self.map[stateType].values():
-                total += tracker.getTotalWaterUsage()
-        return total
+        electricityUsage = waterUsage = 0.0
+        for tracker in self.map.values():
+            if tracker.totalTimeTrue:
+                trackerElectricityUsage, trackerWaterUsage = tracker.getTotalUsage()
+                electricityUsage += trackerElectricityUsage
+                waterUsage += trackerWaterUsage
+        return electricityUsage, waterUsage
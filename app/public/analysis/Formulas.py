@@ -2,6 +2,25 @@
 from typing import Tuple
 
 
+# Natural indoor temp change
+BASE_INDOOR_CHANGE_RATE = 2 / (3600 * 10)  # F / s*F
+OPEN_DOOR_INDOOR_CHANGE_RATE = 2 / (60 * 5 * 10)  # F / s*F
+OPEN_WINDOW_INDOOR_CHANGE_RATE = 1 / (60 * 5 * 10)  # F / s*F
+
+# HVAC
+HVAC_TEMP_TOLERANCE = 2  # F
+HVAC_TEMP_CHANGE_PER_SEC = 1 / 60  # F / s
+HVAC_ELECTRICITY_USAGE_RATE = 3500 / 3600  # W / s
+
+# Water heater
+WATER_HEATER_SPEED = 1 / 4 / 60  # G / s
+WATER_HEATER_ELECTRICITY_USAGE_RATE = 4500 / 3600  # W / s
+
+# Costs
+ELECTRICITY_COST_RATE = 0.12 / 1000 / 3600  # Dollars per watt-second
+WATER_COST_RATE = 2.52 / 100 / 7.48  # Dollars per gallon
+
+
 class Formulas:
     """
     NOTE: all time values are represented in app seconds.
@@ -12,91 +31,51 @@ class Formulas:
     """
 
     @staticmethod
-    def naturalIndoorTempChange(
+    def indoorTempAndHvacElectricityUsage(
         indoorTemp: float,
         outdoorTemp: float,
+        thermostatTemp: float,
         totalTime: float,
         openDoorTime: float,
         openWindowTime: float,
-    ) -> float:
+    ) -> Tuple[float, float]:
         """
+        Calculates the new indoor temp and the HVAC electricity usage since the last
+        calculation based on the previous indoor temp and other variables.
+
         The indoor temp changes naturally in the following (cumulative) ways:
         - For every 10 deg F difference in outdoor temp, indoor temp changes +/- 2 deg F per hour.
         - For every 10 deg F difference in outdoor temp, indoor temp changes +/- 2 deg F per 5 min of open door time.
         - For every 10 deg F difference in outdoor temp, indoor temp changes +/- 1 deg F per 5 min of open window time.
-        """
-        baseIndoorChangePerSecPerOutdoorDiff = 2 / (3600 * 10)  # F / s*F
-        indoorChangePerOpenDoorSecPerOutdoorDiff = 2 / (60 * 5 * 10)  # F / s*F
-        indoorChangePerOpenWindowSecPerOutdoorDiff = 1 / (60 * 5 * 10)  # F / s*F
-
-        outdoorDiff = abs(outdoorTemp - indoorTemp)
-        changeDirection = 1 if outdoorTemp > indoorTemp else -1
-        baseChange = baseIndoorChangePerSecPerOutdoorDiff * totalTime * outdoorDiff
-        openDoorChange = (
-            indoorChangePerOpenDoorSecPerOutdoorDiff * openDoorTime * outdoorDiff
-        )
-        openWindowChange = (
-            indoorChangePerOpenWindowSecPerOutdoorDiff * openWindowTime * outdoorDiff
-        )
-        maxPossibleChange = outdoorDiff
-        unclippedChange = baseChange + openDoorChange + openWindowChange
-        actualChange = min(unclippedChange, maxPossibleChange)
-        return changeDirection * actualChange
 
-    @staticmethod
-    def isHvacRunning(indoorTemp: float, thermostatTemp: float) -> bool:
-        """
         HVAC maintains the temp set by the thermostat within 2 deg F; if the indoor
-        temp goes beyond 2 deg F of the thermostat temp, HVAC starts running.
+        temp goes beyond 2 deg F of the thermostat temp, HVAC starts running and
+        changes the indoor temp by 1 deg F per min until it reaches the thermostat temp.
         """
-        return abs(thermostatTemp - indoorTemp) > 2
-
-    @staticmethod
-    def hvacElectricityUsage(hvacRunningTime: float) -> float:
-        electricityUsageRate = 3500 / 3600  # W / s
-        return electricityUsageRate * hvacRunningTime
+        # Natural change
+        outdoorDiff = abs(outdoorTemp - indoorTemp)
+        naturalChange = min(
+            BASE_INDOOR_CHANGE_RATE * totalTime * outdoorDiff
+            + OPEN_DOOR_INDOOR_CHANGE_RATE * openDoorTime * outdoorDiff
+            + OPEN_WINDOW_INDOOR_CHANGE_RATE * openWindowTime * outdoorDiff,
+            outdoorDiff,
+        )
+        if outdoorTemp > indoorTemp:
+            indoorTemp += naturalChange
+        else:
+            indoorTemp -= naturalChange
 
-    @staticmethod
-    def hvacIndoorTempChangeAndElectricityUsage(
-        indoorTemp: float,
-        thermostatTemp: float,
-        totalTime: float,
-    ) -> Tuple[float, float]:
-        """
-        If HVAC is running, it changes the indoor temp by 1 deg F
-        per min until it reaches the thermostat temp.
-        """
-        if not Formulas.isHvacRunning(indoorTemp, thermostatTemp):
-            return 0, 0
-        changePerSecond = 1 / 60  # F / s
+        # HVAC change
         difference = abs(thermostatTemp - indoorTemp)
-        changeDirection = 1 if thermostatTemp > indoorTemp else -1
-        maxPossibleChange = changePerSecond * totalTime
-        actualChange = min(difference, maxPossibleChange)
-        hvacRunningTime = actualChange / changePerSecond
-        hvacElectricityUsage = Formulas.hvacElectricityUsage(hvacRunningTime)
-        return changeDirection * actualChange, hvacElectricityUsage
-
-    @staticmethod
-    def indoorTempAndHvacElectricityUsage(
-        indoorTemp: float,
-        outdoorTemp: float,
-        thermostatTemp: float,
-        totalTime: float,
-        openDoorTime: float,
-        openWindowTime: float,
-    ) -> Tuple[float, float]:
-        """
-        Calculates the new indoor temp and the HVAC electricity usage since the last
-        calculation based on the previous indoor temp and other variables.
-        """
-        naturalChange = Formulas.naturalIndoorTempChange(
-            indoorTemp, outdoorTemp, totalTime, openDoorTime, openWindowTime
-        )
-        hvacChange, electricityUsage = Formulas.hvacIndoorTempChangeAndElectricityUsage(
-            indoorTemp + naturalChange, thermostatTemp, totalTime
+        if difference <= HVAC_TEMP_TOLERANCE:  # HVAC isn't running
+            return indoorTemp, 0
+        hvacChange = min(difference, HVAC_TEMP_CHANGE_PER_SEC * totalTime)
+        electricityUsage = HVAC_ELECTRICITY_USAGE_RATE * (
+            hvacChange / HVAC_TEMP_CHANGE_PER_SEC
         )
-        return indoorTemp + naturalChange + hvacChange, electricityUsage
+        if thermostatTemp > indoorTemp:
+            return indoorTemp + hvacChange, electricityUsage
+        return indoorTemp - hvacChange, electricityUsage
 
     @staticmethod
     def usage(usageRate: float, totalTime: float) -> float:
@@ -118,24 +97,24 @@ class Formulas:
 
     @staticmethod
     def waterHeaterRunningTime(waterToHeat: float) -> float:
-        waterHeaterSpeed = 1 / 4 / 60  # G / s
-        return waterToHeat / waterHeaterSpeed
+        return waterToHeat / WATER_HEATER_SPEED
 
     @staticmethod
     def waterHeaterElectricityUsage(
         waterUsageRate: float, totalTime: float, percentHot: float
     ) -> float:
-        electricityUsageRate = 4500 / 3600  # W / s
         hotWaterUsage = Formulas.hotWaterUsage(waterUsageRate, totalTime, percentHot)
+        return Formulas.hotWaterHeaterElectricityUsage(hotWaterUsage)
+
+    @staticmethod
+    def hotWaterHeaterElectricityUsage(hotWaterUsage: float) -> float:
         runningTime = Formulas.waterHeaterRunningTime(hotWaterUsage)
-        return electricityUsageRate * runningTime
+        return WATER_HEATER_ELECTRICITY_USAGE_RATE * runningTime
 
     @staticmethod
     def electricityCost(electricityUsage: float, totalTime: float) -> float:
-        costRate = 0.12 / 1000 / 3600  # Dollars per watt-second
-        return costRate * electricityUsage * totalTime
+        return ELECTRICITY_COST_RATE * electricityUsage * totalTime
 
     @staticmethod
     def waterCost(waterUsage: float) -> float:
-        costRate = 2.52 / 100 / 7.48  # Dollars per gallon
-        return costRate * waterUsage
+        return WATER_COST_RATE * waterUsage
@@ -16,7 +16,12 @@ from apscheduler.executors.pool import ThreadPoolExecutor, ProcessPoolExecutor
 from public.constants import *
 from public.time.AppClock import AppClock
 from public.time.TimePublisher import TimePublisher
-from public.events.Event import UserGeneratedEvent, queryEvents, isThermostatEvent
+from public.events.Event import (
+    UserGeneratedEvent,
+    queryEvents,
+    isThermostatEvent,
+    STATE_TYPE_KEY_PAIRS,
+)
 from public.events.EventStore import EventStore
 from public.events.EventPublisher import EventPublisher
 from public.analysis.AnalysisPublisher import AnalysisPublisher
@@ -147,6 +152,12 @@ def userGeneratedEvent():
         check_type("`event`", event, UserGeneratedEvent)
     except TypeError as e:
         return f"The value of `event` is invalid... {e.args[0]}", 400
+    if (event["state_type"], event["state_key"]) not in STATE_TYPE_KEY_PAIRS:
+        return (
+            f'The state type of `event` should not be "{event["state_type"]}"'
+            f' for the state key "{event["state_key"]}"',
+            400,
+        )
 
     if isThermostatEvent(event):
         if event["new_value"] < MIN_THERMOSTAT_TEMP:
@@ -1,10 +1,10 @@
 # STL
-from random import randint
-from typing import List, TypedDict, Literal, Union
+from sys import intern
+from itertools import cycle
+from typing import Dict, List, Tuple, TypedDict, Literal, Union, get_args
 
 # PDM
-import psycopg2
-from psycopg2.extras import RealDictCursor
+import numpy as np
 
 # LOCAL
 from public.constants import (
@@ -120,6 +120,72 @@ UserGeneratedBooleanStateKey = Literal[
     "kitchenWindow2",
 ]
 StateKey = Union[IntegerStateKey, BooleanStateKey]
+INTEGER_STATE_TYPES = frozenset(get_args(IntegerStateType))
+BOOLEAN_STATE_TYPES = frozenset(get_args(BooleanStateType))
+
+# The state type(s) of each state key (faucets have both bath and shower events),
+# which `generate_events.py` also generates events from
+STATE_KEY_TYPES: Dict[StateKey, Tuple[StateType, ...]] = {
+    "outdoorTemp": ("temp",),
+    "thermostatTemp": ("temp",),
+    "bedroom1OverheadLight": ("light",),
+    "bedroom1Lamp1": ("light",),
+    "bedroom1Lamp2": ("light",),
+    "bedroom1Window1": ("window",),
+    "bedroom1Window2": ("window",),
+    "bedroom1Tv": ("bedroomTv",),
+    "bedroom2OverheadLight": ("light",),
+    "bedroom2Lamp1": ("light",),
+    "bedroom2Lamp2": ("light",),
+    "bedroom2Window1": ("window",),
+    "bedroom2Window2": ("window",),
+    "bedroom3OverheadLight": ("light",),
+    "bedroom3Lamp1": ("light",),
+    "bedroom3Lamp2": ("light",),
+    "bedroom3Window1": ("window",),
+    "bedroom3Window2": ("window",),
+    "bathroom1OverheadLight": ("light",),
+    "bathroom1ExhaustFan": ("bathExhaustFan",),
+    "bathroom1Window": ("window",),
+    "bathroom1Faucet": ("bath", "shower"),  # Depends on the event
+    "bathroom2OverheadLight": ("light",),
+    "bathroom2ExhaustFan": ("bathExhaustFan",),
+    "bathroom2Window": ("window",),
+    "bathroom2Faucet": ("bath", "shower"),  # Depends on the event
+    "clothesWasher": ("clothesWasher",),
+    "clothesDryer": ("clothesDryer",),
+    "frontDoor": ("door",),
+    "backDoor": ("door",),
+    "garageHouseDoor": ("door",),
+    "garageCarDoor1": ("door",),
+    "garageCarDoor2": ("door",),
+    "livingRoomOverheadLight": ("light",),
+    "livingRoomLamp1": ("light",),
+    "livingRoomLamp2": ("light",),
+    "livingRoomTv": ("livingRoomTv",),
+    "livingRoomWindow1": ("window",),
+    "livingRoomWindow2": ("window",),
+    "livingRoomWindow3": ("window",),
+    "kitchenOverheadLight": ("light",),
+    "kitchenStove": ("stove",),
+    "kitchenOven": ("oven",),
+    "kitchenMicrowave": ("microwave",),
+    "kitchenRefrigerator": ("refrigerator",),
+    "kitchenDishWasher": ("dishWasher",),
+    "kitchenWindow1": ("window",),
+    "kitchenWindow2": ("window",),
+}
+# Every valid (state type, state key) pair
+STATE_TYPE_KEY_PAIRS = frozenset(
+    (stateType, stateKey)
+    for stateKey, stateTypes in STATE_KEY_TYPES.items()
+    for stateType in stateTypes
+)
+
+QUERY_BATCH_SIZE = 10000  # Number of rows fetched at a time when querying events
+
+# Door and window test events alternate between these new values and messages
+TEST_OPEN_CLOSE_VALUES_AND_MESSAGES = ((True, "opened"), (False, "closed"))
 
 
 class IntegerEvent(TypedDict):
@@ -178,11 +244,12 @@ Event = Union[IntegerEvent, BooleanEvent, UserGeneratedEvent]
 
 
 def isIntegerEvent(event: Event) -> bool:
-    return isinstance(event["new_value"], int)
+    # Checked by state type, since `bool` values are also instances of `int`
+    return event["state_type"] in INTEGER_STATE_TYPES
 
 
 def isBooleanEvent(event: Event) -> bool:
-    return isinstance(event["new_value"], bool)
+    return event["state_type"] in BOOLEAN_STATE_TYPES
 
 
 def isThermostatEvent(event: Event) -> bool:
@@ -193,13 +260,32 @@ def queryEvents(postgresDsn: str) -> List[Event]:
     """
     Returns all pre-generated events from the database.
     """
+    # Imported here, so that events can be used without the database driver (see `testEvents`)
+    import psycopg2
+
     events: List[Event] = []
     with psycopg2.connect(dsn=postgresDsn) as con:
-        with con.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute("SELECT * FROM pre_generated_events.integer_event")
-            events.extend([IntegerEvent(**e) for e in cur.fetchall()])
-            cur.execute("SELECT * FROM pre_generated_events.boolean_event")
-            events.extend([BooleanEvent(**e) for e in cur.fetchall()])
+        for table in ("integer_event", "boolean_event"):
+            # Named (server-side) cursors stream rows in batches instead of all at once
+            with con.cursor(name=table) as cur:
+                cur.itersize = QUERY_BATCH_SIZE
+                cur.execute(
+                    "SELECT time, state_type, state_key, new_value, message"
+                    f" FROM pre_generated_events.{table}"
+                )
+                # Events are built as plain dicts from row tuples, with their strings
+                # interned, so that the many events sharing a state type, state key,
+                # or message also share a single copy of it
+                events.extend(
+                    {
+                        "time": time,
+                        "state_type": intern(stateType),
+                        "state_key": intern(stateKey),
+                        "new_value": newValue,
+                        "message": intern(message),
+                    }
+                    for time, stateType, stateKey, newValue, message in cur
+                )
     return events
 
 
@@ -237,44 +323,60 @@ def testEvents() -> List[Event]:
             "message": "initial value",
         },
     ]
-    for i in range(10000):  # Door events
-        randomTestEvents.append(
-            {
-                "time": randint(MIN_APP_TIME + 1, MAX_APP_TIME),
-                "state_type": "door",
-                "state_key": "frontDoor",
-                "new_value": i % 2 == 0,
-                "message": "opened" if i % 2 == 0 else "closed",
-            }
-        )
-    for i in range(10000):  # Window events
-        randomTestEvents.append(
-            {
-                "time": randint(MIN_APP_TIME + 1, MAX_APP_TIME),
-                "state_type": "window",
-                "state_key": "kitchenWindow1",
-                "new_value": i % 2 == 0,
-                "message": "opened" if i % 2 == 0 else "closed",
-            }
-        )
-    for _ in range(20000):  # Outdoor temp events
-        randomTestEvents.append(
-            {
-                "time": randint(MIN_APP_TIME + 1, MAX_APP_TIME),
-                "state_type": "temp",
-                "state_key": "outdoorTemp",
-                "new_value": randint(30, 100),
-                "message": "changed",
-            }
+    rng = np.random.default_rng()
+    # Random times and values are drawn all at once, rather than once per event
+    doorTimes = rng.integers(MIN_APP_TIME + 1, MAX_APP_TIME, 10000, endpoint=True)
+    windowTimes = rng.integers(MIN_APP_TIME + 1, MAX_APP_TIME, 10000, endpoint=True)
+    outdoorTempTimes = rng.integers(
+        MIN_APP_TIME + 1, MAX_APP_TIME, 20000, endpoint=True
+    )
+    outdoorTemps = rng.integers(30, 100, 20000, endpoint=True)
+    thermostatTimes = rng.integers(MIN_APP_TIME + 1, MAX_APP_TIME, 20000, endpoint=True)
+    thermostatTemps = rng.integers(
+        MIN_THERMOSTAT_TEMP, MAX_THERMOSTAT_TEMP, 20000, endpoint=True
+    )
+    randomTestEvents.extend(  # Door events
+        {
+            "time": time,
+            "state_type": "door",
+            "state_key": "frontDoor",
+            "new_value": newValue,
+            "message": message,
+        }
+        for time, (newValue, message) in zip(
+            doorTimes.tolist(), cycle(TEST_OPEN_CLOSE_VALUES_AND_MESSAGES)
         )
-    for _ in range(20000):  # Thermostat events
-        randomTestEvents.append(
-            {
-                "time": randint(MIN_APP_TIME + 1, MAX_APP_TIME),
-                "state_type": "temp",
-                "state_key": "thermostatTemp",
-                "new_value": randint(MIN_THERMOSTAT_TEMP, MAX_THERMOSTAT_TEMP),
-                "message": "changed",
-            }
+    )
+    randomTestEvents.extend(  # Window events
+        {
+            "time": time,
+            "state_type": "window",
+            "state_key": "kitchenWindow1",
+            "new_value": newValue,
+            "message": message,
+        }
+        for time, (newValue, message) in zip(
+            windowTimes.tolist(), cycle(TEST_OPEN_CLOSE_VALUES_AND_MESSAGES)
         )
+    )
+    randomTestEvents.extend(  # Outdoor temp events
+        {
+            "time": time,
+            "state_type": "temp",
+            "state_key": "outdoorTemp",
+            "new_value": temp,
+            "message": "changed",
+        }
+        for time, temp in zip(outdoorTempTimes.tolist(), outdoorTemps.tolist())
+    )
+    randomTestEvents.extend(  # Thermostat events
+        {
+            "time": time,
+            "state_type": "temp",
+            "state_key": "thermostatTemp",
+            "new_value": temp,
+            "message": "changed",
+        }
+        for time, temp in zip(thermostatTimes.tolist(), thermostatTemps.tolist())
+    )
     return randomTestEvents
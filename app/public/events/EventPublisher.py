@@ -3,7 +3,6 @@ from logging import Logger
 
 # PDM
 from flask import Flask
-from typeguard import typechecked
 from apscheduler.schedulers.background import BackgroundScheduler
 
 # LOCAL
@@ -23,7 +22,6 @@ class EventPublisher(SSEPublisher):
     lastPublishTime: int
 
     # Override
-    @typechecked
     def __init__(
         self,
         logger: Logger,
@@ -63,5 +61,4 @@ class EventPublisher(SSEPublisher):
         """
         start = self.lastPublishTime
         end = self.lastPublishTime = int(self.clock.time())
-        for event in self.eventStore.yieldPreGeneratedEvents(start, end):
-            self.publish(event)
+        self.publish(*self.eventStore.getPreGeneratedEvents(start, end))
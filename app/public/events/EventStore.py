@@ -1,5 +1,6 @@
 # STL
-from typing import Any, Set, Dict, Generator, Literal, Optional
+from bisect import bisect_left, insort
+from typing import Any, Set, Callable, Dict, List, Generator, Literal, Optional
 
 # LOCAL
 from public.events.Event import Event, StateKey
@@ -11,11 +12,43 @@ EventMap = Dict[int, Dict[StateKey, Dict[EventType, Event]]]
 `EventMap` is a custom map data structure that indexes events by time, state key,
 and event type to support fast insertions and retrievals.
 
-Retrieving or removing many events at once requires iterating over app time, which
-results in `O(1)` time complexity because app time is bounded by constants.
+Retrieving many events at once binary searches a sorted list of the times in the map,
+and then only visits times that have events.
 """
 
 
+def getPreferredEvent(container: Dict[EventType, Event]) -> Optional[Event]:
+    """
+    Returns either the pre-generated event or the user-generated event, with a preference
+    of the user-generated event (because user-generated events take precedence over
+    pre-generated events in the smart home simulation).
+    """
+    return container.get("user-generated") or container.get("pre-generated")
+
+
+def getPreGeneratedEventFromContainer(
+    container: Dict[EventType, Event]
+) -> Optional[Event]:
+    return container.get("pre-generated")
+
+
+def getUserGeneratedEventFromContainer(
+    container: Dict[EventType, Event]
+) -> Optional[Event]:
+    return container.get("user-generated")
+
+
+# Functions returning the event of the given event type from a container,
+# or the preferred event if no event type is given
+CONTAINER_EVENT_GETTERS: Dict[
+    Optional[EventType], Callable[[Dict[EventType, Event]], Optional[Event]]
+] = {
+    None: getPreferredEvent,
+    "pre-generated": getPreGeneratedEventFromContainer,
+    "user-generated": getUserGeneratedEventFromContainer,
+}
+
+
 class EventStore:
     """
     A class wrapping an `EventMap` used for storing events during the smart home simulation.
@@ -26,9 +59,21 @@ class EventStore:
       filtered by time, state key, and event type.
     """
 
-    map: EventMap = {}
+    __slots__ = (
+        "map",
+        "minTime",
+        "maxTime",
+        "sortedTimes",
+    )
+
+    map: EventMap
     minTime: int
     maxTime: int
+    sortedTimes: Optional[List[int]]  # All times in the map, once first needed
+
+    def __init__(self) -> None:
+        self.map = {}  # Per instance, so that separate stores never share events
+        self.sortedTimes = None
 
     def isEmpty(self) -> bool:
         return not bool(self.map)
@@ -42,12 +87,16 @@ class EventStore:
             if time > getattr(self, "maxTime", float("-inf")):
                 self.maxTime = time
 
-            if time not in self.map:
-                self.map[time] = {}
-            if stateKey not in self.map[time]:
-                self.map[time][stateKey] = {}
+            containers = self.map.get(time)
+            if containers is None:
+                containers = self.map[time] = {}
+                if self.sortedTimes is not None:
+                    insort(self.sortedTimes, time)
+            container = containers.get(stateKey)
+            if container is None:
+                container = containers[stateKey] = {}
 
-            self.map[time][stateKey][eventType] = event
+            container[eventType] = event
 
     def putPreGeneratedEvents(self, *events: Event) -> None:
         self.putEvents("pre-generated", *events)
@@ -56,11 +105,10 @@ class EventStore:
         self.putEvents("user-generated", *events)
 
     def clearUserGeneratedEvents(self) -> None:
-        for time in range(self.minTime, self.maxTime + 1):
-            if time not in self.map:
-                continue
-            for stateKey in list(self.map[time]):
-                self.map[time][stateKey].pop("user-generated", None)
+        # Emptied containers are kept, so events put again keep their order within a time
+        for containers in self.map.values():
+            for container in containers.values():
+                container.pop("user-generated", None)
 
     def getEvent(self, time: int, stateKey: StateKey, eventType: EventType) -> Event:
         return self.map[time][stateKey][eventType]
@@ -97,18 +145,6 @@ class EventStore:
         Yields events across the given timeframe that have the given state keys and event type.
         If any parameters are not provided, the associated constaints are simply ignored.
         """
-
-        def getEventFromContainer(container: Dict[EventType, Event]) -> Optional[Event]:
-            """
-            If `eventType` was provided, returns the event of that type. Otherwise,
-            returns either the pre-generated event or the user-generated event, with
-            a preference of the user-generated event (because user-generated events take
-            precedence over pre-generated events in the smart home simulation).
-            """
-            if eventType:
-                return container.get(eventType)
-            return container.get("user-generated") or container.get("pre-generated")
-
         if not self.map:
             return
 
@@ -117,19 +153,24 @@ class EventStore:
         if endTime is None:
             endTime = self.maxTime + 1
 
-        for time in range(startTime, endTime):
-            if time not in self.map:
-                continue
+        getEventFromContainer = CONTAINER_EVENT_GETTERS[eventType]
+        sortedTimes = self.getSortedTimes()
+        first = bisect_left(sortedTimes, startTime)
+        last = bisect_left(sortedTimes, endTime, first)
+        eventMap = self.map
+        for time in sortedTimes[first:last]:
+            containers = eventMap[time]
             if stateKeys:
                 for stateKey in stateKeys:
-                    if stateKey not in self.map[time]:
+                    container = containers.get(stateKey)
+                    if container is None:
                         continue
-                    event = getEventFromContainer(self.map[time][stateKey])
+                    event = getEventFromContainer(container)
                     if event:
                         yield event
             else:
-                for stateKey in self.map[time]:
-                    event = getEventFromContainer(self.map[time][stateKey])
+                for container in containers.values():
+                    event = getEventFromContainer(container)
                     if event:
                         yield event
 
@@ -149,6 +190,31 @@ class EventStore:
     ) -> Generator[Event, None, None]:
         return self.yieldEvents(startTime, endTime, stateKeys, "user-generated")
 
+    def getPreGeneratedEvents(self, startTime: int, endTime: int) -> List[Event]:
+        """
+        Returns the same events as `yieldPreGeneratedEvents` for the given timeframe,
+        but built as a list in one pass instead of yielded one by one.
+        """
+        sortedTimes = self.getSortedTimes()
+        first = bisect_left(sortedTimes, startTime)
+        last = bisect_left(sortedTimes, endTime, first)
+        eventMap = self.map
+        return [
+            container["pre-generated"]
+            for time in sortedTimes[first:last]
+            for container in eventMap[time].values()
+            if "pre-generated" in container
+        ]
+
+    def getSortedTimes(self) -> List[int]:
+        """
+        Returns all times that have events, in ascending order.
+        The result is cached, and kept up to date as events are put.
+        """
+        if self.sortedTimes is None:
+            self.sortedTimes = sorted(self.map)
+        return self.sortedTimes
+
     def getFirstEvent(self, stateKey: StateKey) -> Event:
         return next(self.yieldEvents(stateKeys={stateKey}))
 
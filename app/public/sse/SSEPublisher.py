@@ -5,13 +5,12 @@ from typing import Any, Literal
 from abc import ABC, abstractmethod
 
 # PDM
-from flask import Flask
-from flask_sse import sse
-from typeguard import typechecked
+from flask import Flask, json
+from flask_sse import sse, Message
 from apscheduler.schedulers.background import BackgroundScheduler
 
 # LOCAL
-from public.constants import REAL_TIME, APP_TIME
+from public.constants import REAL_TIME, APP_TIME, SSE_CHANNEL
 from public.time.AppClock import AppClock
 
 TimeType = Literal[REAL_TIME, APP_TIME]
@@ -29,6 +28,16 @@ class SSEPublisher(ABC):
     - override the `prepare` method (if necessary)
     """
 
+    __slots__ = (
+        "logger",
+        "app",
+        "clock",
+        "scheduler",
+        "jobIntervalSeconds",
+        "jobIntervalTimeType",
+        "jobID",
+    )
+
     sseType: str = "CHANGE_ME"  # NOTE: implementing classes should override this!
 
     logger: Logger
@@ -39,7 +48,6 @@ class SSEPublisher(ABC):
     jobIntervalTimeType: TimeType
     jobID: int
 
-    @typechecked
     def __init__(
         self,
         logger: Logger,
@@ -114,9 +122,18 @@ class SSEPublisher(ABC):
         Publishes each of the given data as SSEs from the
         provided app through the provided SSE channel.
         """
+        if not data:
+            return
         with self.app.app_context():
+            # `sse.publish` connects to Redis for every SSE, so the SSEs
+            # are instead sent the same way through a single pipeline
+            # NOTE: keep the message format in sync with
+            # `flask_sse.ServerSentEventsBlueprint.publish`
+            pipeline = sse.redis.pipeline(transaction=False)
             for d in data:
-                sse.publish(d, type=self.sseType)
+                message = Message(d, type=self.sseType)
+                pipeline.publish(SSE_CHANNEL, json.dumps(message.to_dict()))
+            pipeline.execute()
 
     def prepare(self) -> None:
         """
@@ -1,10 +1,8 @@
 # STL
 from time import time
+from typing import Tuple
 from datetime import datetime
 
-# PDM
-from typeguard import typechecked
-
 # LOCAL
 from public.constants import SIMULATION_START_DATE_TIMESTAMP
 
@@ -21,14 +19,24 @@ class AppClock:
     - preventing time from going beyond the provided maximum time
     """
 
+    __slots__ = (
+        "running",
+        "minTime",
+        "maxTime",
+        "speedupFactor",
+        "appTimeZero",
+        "realTimeZero",
+        "lastTimeString",
+    )
+
     running: bool
     minTime: float
     maxTime: float
     speedupFactor: float
     appTimeZero: float
     realTimeZero: float
+    lastTimeString: Tuple[int, str]  # Last app second and its time string
 
-    @typechecked
     def __init__(self, minTime: float, maxTime: float, speedupFactor: float) -> None:
         """
         - `minTime` and `maxTime` are in app seconds.
@@ -38,6 +46,7 @@ class AppClock:
         self.minTime = minTime
         self.maxTime = maxTime
         self.speedupFactor = speedupFactor
+        self.lastTimeString = (-1, "")
 
     def start(self) -> None:
         """
@@ -55,7 +64,8 @@ class AppClock:
         realTimePassed = time() - self.realTimeZero
         appTimePassed = realTimePassed * self.speedupFactor
         unboundAppTime = self.appTimeZero + appTimePassed
-        return min(unboundAppTime, self.maxTime)
+        # Compared directly rather than with `min`, since this runs for every job
+        return unboundAppTime if unboundAppTime <= self.maxTime else self.maxTime
 
     def getAbsoluteSimulationTimeString(self) -> str:
         """
@@ -71,11 +81,18 @@ class AppClock:
         secondsPerDay = 86400
 
         fromTime = SIMULATION_START_DATE_TIMESTAMP
-        additionalTime = self.time()
+        additionalTime = int(self.time())  # The string only shows whole seconds
+
+        # Reuse the last string while app time is still in the same second
+        lastAdditionalTime, lastTimeString = self.lastTimeString
+        if additionalTime == lastAdditionalTime:
+            return lastTimeString
 
         dayNum = int(additionalTime / secondsPerDay + 1)
         dt = datetime.fromtimestamp(fromTime + additionalTime)
-        return dt.strftime(f"%I:%M:%S %p\n%A\nDay {dayNum}")
+        timeString = dt.strftime(f"%I:%M:%S %p\n%A\nDay {dayNum}")
+        self.lastTimeString = (additionalTime, timeString)
+        return timeString
 
     def getAbsoluteSimulationTimeDays(self) -> float:
         """
@@ -0,0 +1,73 @@
+# STL
+import random
+import unittest
+from typing import List
+
+# LOCAL
+from public.events.Event import Event, STATE_TYPE_KEY_PAIRS
+from public.events.EventStore import EventStore, getPreferredEvent
+
+NUM_SEQUENCES = 200  # Number of random put/clear sequences
+NUM_OPERATIONS = 40  # Number of puts and clears in each sequence
+MAX_TIME = 100  # Small, so that random events often share a time and state key
+
+SORTED_STATE_TYPE_KEY_PAIRS = sorted(STATE_TYPE_KEY_PAIRS)  # For reproducible choices
+
+
+def randomEvent(rng: random.Random) -> Event:
+    stateType, stateKey = rng.choice(SORTED_STATE_TYPE_KEY_PAIRS)
+    newValue = rng.randint(55, 85) if stateType == "temp" else rng.random() < 0.5
+    return {
+        "time": rng.randint(0, MAX_TIME),
+        "state_type": stateType,
+        "state_key": stateKey,
+        "new_value": newValue,
+        "message": "test",
+    }
+
+
+def allEventsInTimeframe(eventStore: EventStore, start: int, end: int) -> List[Event]:
+    """Returns the preferred events of the timeframe by visiting every time in the map"""
+    return [
+        event
+        for time in sorted(eventStore.map)
+        if start <= time < end
+        for event in map(getPreferredEvent, eventStore.map[time].values())
+        if event
+    ]
+
+
+class TestYieldEvents(unittest.TestCase):
+    """
+    Differential tests of `EventStore.yieldEvents`, which binary searches the sorted
+    times that `EventStore` keeps up to date as events are put, against a scan of
+    every time in the map.
+    """
+
+    def test_yielded_events_match_scanned_events(self) -> None:
+        for seed in range(NUM_SEQUENCES):
+            rng = random.Random(seed)
+            eventStore = EventStore()
+            eventStore.putPreGeneratedEvents(*(randomEvent(rng) for _ in range(50)))
+            eventStore.getSortedTimes()
+            for _ in range(NUM_OPERATIONS):
+                operation = rng.random()
+                if operation < 0.1:
+                    eventStore.clearUserGeneratedEvents()
+                elif operation < 0.6:
+                    eventStore.putUserGeneratedEvents(randomEvent(rng))
+                else:
+                    eventStore.putPreGeneratedEvents(randomEvent(rng))
+                start = rng.randint(0, MAX_TIME)
+                end = rng.randint(start, MAX_TIME + 1)
+                with self.subTest(seed=seed, start=start, end=end):
+                    self.assertEqual(
+                        list(eventStore.yieldEvents(start, end)),
+                        allEventsInTimeframe(eventStore, start, end),
+                    )
+            with self.subTest(seed=seed):
+                self.assertEqual(eventStore.getSortedTimes(), sorted(eventStore.map))
+
+
+if __name__ == "__main__":
+    unittest.main()